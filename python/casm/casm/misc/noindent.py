@@ -1,5 +1,5 @@
 import json
-import six
+import re
 import uuid
 
 # ---------------------------------------------------
@@ -8,6 +8,9 @@ import uuid
 # answer: http://stackoverflow.com/a/25935321
 # code by: http://stackoverflow.com/users/247623/erik-allik
 
+# matches the quoted placeholders written by NoIndentEncoder.default
+_PLACEHOLDER_RE = re.compile(r'"@@([0-9a-f]{32})@@"')
+
 class NoIndent(object):
     def __init__(self, value):
         self.value = value
@@ -30,7 +33,7 @@ class NoIndentEncoder(json.JSONEncoder):
 
     def encode(self, o):
         result = super(NoIndentEncoder, self).encode(o)
-        for k, v in six.iteritems(self._replacement_map):
-            result = result.replace('"@@%s@@"' % (k,), v)
-        return result
+        # substitute all placeholders in a single pass over the result
+        return _PLACEHOLDER_RE.sub(
+            lambda m: self._replacement_map.get(m.group(1), m.group(0)), result)
 # ---------------------------------------------------
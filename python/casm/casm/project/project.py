@@ -297,20 +297,60 @@ class DirectoryStructure(object):
             directories, or None if not found.
 
         """
-        filepath = join(self.configuration_calc_settings_dir(configname, clex), filename)
-        if os.path.exists(filepath):
-          return filepath
+        for settings_dir in self._settings_dirs(configname, clex):
+          filepath = join(settings_dir, filename)
+          if os.path.exists(filepath):
+            return filepath
 
-        scelname = configname.split('/')[0]
-        filepath = join(self.supercell_calc_settings_dir(scelname, clex), filename)
-        if os.path.exists(filepath):
-          return filepath
+        return None
 
-        filepath = join(self.calc_settings_dir(clex), filename)
-        if os.path.exists(filepath):
-          return filepath
+    def settings_paths_crawl(self, filenames, configname, clex):
+        """
+        Returns the paths to the first files named as in 'filenames' found in
+        the settings directories.
 
-        return None
+        Searches the same directories as settings_path_crawl, but checks which
+        of them exist only once, rather than once per file.
+
+
+        Arguments
+        ---------
+          filenames: list of str
+            The names of the files being searched for
+
+          configname: str
+            The name of the configuration
+
+          clex: a casm.project.ClexDescription instance
+            Used to specify the calctype to find settings for
+
+
+        Returns
+        ---------
+          filepaths: list of str or None
+            For each name in 'filenames', the path to the first file with that
+            name found in the settings directories, or None if not found.
+
+        """
+        settings_dirs = [d for d in self._settings_dirs(configname, clex) if os.path.isdir(d)]
+
+        filepaths = []
+        for filename in filenames:
+          for settings_dir in settings_dirs:
+            filepath = join(settings_dir, filename)
+            if os.path.exists(filepath):
+              break
+          else:
+            filepath = None
+          filepaths.append(filepath)
+        return filepaths
+
+    def _settings_dirs(self, configname, clex):
+      """Return the settings directory paths, in the order they are searched"""
+      scelname = configname.split('/')[0]
+      return [self.configuration_calc_settings_dir(configname, clex),
+              self.supercell_calc_settings_dir(scelname, clex),
+              self.calc_settings_dir(clex)]
 
     def supercell_dir(self, scelname):
       """Return supercell directory path (scelname has format SCELV_A_B_C_D_E_F)"""
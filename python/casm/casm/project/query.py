@@ -8,7 +8,6 @@ warnings.filterwarnings("ignore", message="numpy.dtype size changed")
 warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
 
 from io import StringIO
-import pandas
 import six
 import casm
 from casm.misc import compat
@@ -27,6 +26,8 @@ def query(proj, columns, selection=None, verbatim=True, all=False):
      Returns:
        data: a pandas DataFrame containing the query results
   """
+  # imported here, not at module level, so that importing casm.project stays cheap
+  import pandas
   args = _query_args(proj, columns, selection, verbatim, all, api=True)
 
   stdout, stderr, returncode = proj.capture(args)
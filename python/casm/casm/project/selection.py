@@ -14,7 +14,6 @@ import os
 import subprocess
 
 import numpy as np
-import pandas
 import six
 
 from casm.project.project import Project
@@ -88,6 +87,7 @@ class Selection(object):
         If the data is modified, 'save' must be called for CASM to use the modified selection.
         """
         if self._data is None:
+          import pandas
           if self.path in ["MASTER", "ALL", "CALCULATED"]:
             self._data = query(self.proj, ['configname', 'selected'], self, all=self.all)
           elif self._is_json():
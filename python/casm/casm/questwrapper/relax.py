@@ -93,8 +93,8 @@ class Relax(object):
         print("  Input directory:", configdir)
 
         # get the configname from the configdir path
-        _res = os.path.split(configdir)
-        self.configname = os.path.split(_res[0])[1] + "/" + _res[1]
+        scelpath, configid = os.path.split(configdir)
+        self.configname = os.path.basename(scelpath) + "/" + configid
         print("  Configuration:", self.configname)
 
         print("  Reading CASM settings")
@@ -3,6 +3,7 @@ from builtins import *
 
 import argparse
 import json
+import multiprocessing
 from os import getcwd
 from os.path import join, abspath
 import sys
@@ -46,6 +47,37 @@ report_help = """
 Report calculation results (print calc.properties.json file) for all selected configurations.
 """
 
+def _relaxation(software, configdir):
+  """Construct the relaxation object for one configuration using 'software'"""
+  if software == "quantumespresso":
+    return casm.qewrapper.Relax(configdir)
+  return Relax(configdir)
+
+def _setup_config(args):
+  """Setup the calculation for one configuration; used as a multiprocessing.Pool task
+
+  Errors are re-raised naming 'configdir', since output from parallel setups is interleaved.
+  """
+  software, configdir = args
+  try:
+    _relaxation(software, configdir).setup()
+  except Exception as e:
+    raise RuntimeError("Error setting up " + configdir + ": " + str(e))
+
+def _report_config(args):
+  """Read the calculated properties for one configuration; used as a multiprocessing.Pool task
+
+  Returns None if the properties could not be read.
+  """
+  software, finaldir, outfilename = args
+  try:
+    if software == "quantumespresso":
+      return casm.qewrapper.Relax.properties(finaldir, outfilename)
+    else:
+      return Relax.properties(finaldir)
+  except Exception:
+    return None
+
 def main(argv = None):
   if argv is None:
     argv = sys.argv[1:]
@@ -85,56 +117,64 @@ def main(argv = None):
         settings["software"]="vasp"
       software=settings["software"]
       print("Relevant software is:", software)
+
+    # per-configuration paths, computed once and shared by all the actions below
+    confignames = list(sel.data["configname"])
+    configdirs = [proj.dir.configuration_dir(configname) for configname in confignames]
+
     if args.setup:
       sel.write_pos()
-      for configname in sel.data["configname"]:
-        if software == "quantumespresso":
-          relaxation = casm.qewrapper.Relax(proj.dir.configuration_dir(configname))
-        else:
-          relaxation = Relax(proj.dir.configuration_dir(configname))
-        relaxation.setup()
+      # setup for each configuration is independent, so write input files in parallel
+      tasks = [(software, configdir) for configdir in configdirs]
+      pool = multiprocessing.Pool(max(1, min(len(tasks), multiprocessing.cpu_count())))
+      try:
+        pool.map(_setup_config, tasks)
+      finally:
+        pool.close()
+        pool.join()
     
     elif args.submit:
       sel.write_pos()
-      for configname in sel.data["configname"]:
-        if software == "quantumespresso":
-          relaxation = casm.qewrapper.Relax(proj.dir.configuration_dir(configname))
-        else:
-          relaxation = Relax(proj.dir.configuration_dir(configname))
-        relaxation.submit()
+      for configdir in configdirs:
+        _relaxation(software, configdir).submit()
     
     elif args.run:
       sel.write_pos()
-      for configname in sel.data["configname"]:
-        if software == "quantumespresso":
-          relaxation = casm.qewrapper.Relax(proj.dir.configuration_dir(configname))
-        else:
-          relaxation = Relax(proj.dir.configuration_dir(configname))
-        relaxation.run()
+      for configdir in configdirs:
+        _relaxation(software, configdir).run()
     
     elif args.report:
-      for configname in sel.data["configname"]:
-        configdir = proj.dir.configuration_dir(configname)
-        clex = proj.settings.default_clex
-        calcdir = proj.dir.calctype_dir(configname, clex)
-        finaldir = join(calcdir, "run.final")
+      clex = proj.settings.default_clex
+      outfilename = None
+      if software == "quantumespresso":
+        if settings["outfilename"] is None:
+            print("WARNING: No output file specified in relax.json using default outfilename of std.out")
+            settings["outfilename"]="std.out"
+        outfilename = settings["outfilename"]
+
+      # parsing the calculation output is independent for each configuration, so do it in parallel
+      calcdirs = [proj.dir.calctype_dir(configname, clex) for configname in confignames]
+      tasks = [(software, join(calcdir, "run.final"), outfilename) for calcdir in calcdirs]
+      pool = multiprocessing.Pool(max(1, min(len(tasks), multiprocessing.cpu_count())))
+      try:
+        outputs = pool.map(_report_config, tasks)
+      finally:
+        pool.close()
+        pool.join()
+
+      for configname, configdir, output in zip(confignames, configdirs, outputs):
         try:
-          if software == "quantumespresso":
-            if settings["outfilename"] is None:
-                print("WARNING: No output file specified in relax.json using default outfilename of std.out")
-                settings["outfilename"]="std.out"
-            outfilename = settings["outfilename"]
-            output = casm.qewrapper.Relax.properties(finaldir,outfilename)
-          else:
-            output = Relax.properties(finaldir)
-          calc_props = proj.dir.calculated_properties(configname, clex)
-          print("writing:", calc_props)
-          with open(calc_props, 'wb') as f:
-              f.write(six.u(json.dumps(output, cls=noindent.NoIndentEncoder, indent=2)).encode('utf-8'))
-        #compat.dump(json, output, calc_props, 'w', cls=noindent.NoIndentEncoder, indent=4, sort_keys=True)
-        except:
-          print(("Unable to report properties for directory {}.\n" 
-                "Please verify that it contains a completed calculation.".format(configdir)))
+          if output is not None:
+            calc_props = proj.dir.calculated_properties(configname, clex)
+            print("writing:", calc_props)
+            with open(calc_props, 'wb') as f:
+                f.write(six.u(json.dumps(output, cls=noindent.NoIndentEncoder, indent=2)).encode('utf-8'))
+            #compat.dump(json, output, calc_props, 'w', cls=noindent.NoIndentEncoder, indent=4, sort_keys=True)
+            continue
+        except Exception:
+          pass
+        print(("Unable to report properties for directory {}.\n" 
+              "Please verify that it contains a completed calculation.".format(configdir)))
   except Exception as e:
     print(e)
     sys.exit(1)
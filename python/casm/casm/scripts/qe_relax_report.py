@@ -22,8 +22,8 @@ def main():
         configdir = os.getcwd()
 
     configdir=os.path.abspath(configdir)
-    _res = os.path.split(configdir)
-    configname = os.path.split(_res[0])[1] + "/" + _res[1]
+    scelpath, configid = os.path.split(configdir)
+    configname = os.path.basename(scelpath) + "/" + configid
 
     casm_settings=casm.project.ProjectSettings()
     if casm_settings == None:
@@ -114,8 +114,9 @@ def continue_job(jobdir, contdir, settings):
     # make the new contdir
     try:
         os.mkdir(contdir)
-    except:
-        pass
+    except OSError:
+        if not os.path.isdir(contdir):
+            raise
 
     # make compressed backups of files sensitive to corruption (e.g. WAVECAR)
     print(" backup:")
@@ -328,14 +329,15 @@ class FEXCFError(_RunError):
                 Reduce POTIM to 0.01
         """
         continue_job(err_jobdir, new_jobdir, settings)
-        if io.get_incar_tag("IBRION", jobdir=new_jobdir) != 2:
+        tags = io.get_incar_tags(["IBRION", "POTIM"], jobdir=new_jobdir)
+        if tags["IBRION"] != 2:
             print("  Set IBRION = 2")
             io.set_incar_tag({"IBRION":2}, jobdir=new_jobdir)
-        elif io.get_incar_tag("POTIM", jobdir=new_jobdir) > 0.1:
+        elif tags["POTIM"] > 0.1:
             print("  Set POTIM = 0.1")
             sys.stdout.flush()
             io.set_incar_tag({"POTIM":0.1}, jobdir=new_jobdir)
-        elif io.get_incar_tag("POTIM", jobdir=new_jobdir) > 0.01:
+        elif tags["POTIM"] > 0.01:
             print("  Set POTIM = 0.01")
             sys.stdout.flush()
             io.set_incar_tag({"POTIM":0.01}, jobdir=new_jobdir)
@@ -365,14 +367,15 @@ class SubSpaceMatrixError(_RunError):
                 Set LREAL = .FALSE.
         """
         continue_job(err_jobdir, new_jobdir, settings)
-        if io.get_incar_tag("ALGO", jobdir=new_jobdir) != "VeryFast":
+        tags = io.get_incar_tags(["ALGO", "IBRION", "LREAL"], jobdir=new_jobdir)
+        if tags["ALGO"] != "VeryFast":
             print("  Set Algo = VeryFast, and Unset IALGO")
             io.set_incar_tag({"IALGO":None, "ALGO":"VeryFast"}, jobdir=new_jobdir)
-        elif io.get_incar_tag("IBRION", jobdir=new_jobdir) != 1:
+        elif tags["IBRION"] != 1:
             print("  Set IBRION = 1 and POTIM = 0.1")
             sys.stdout.flush()
             io.set_incar_tag({"IBRION":1, "POTIM":0.1}, jobdir=new_jobdir)
-        elif io.get_incar_tag("LREAL", jobdir=new_jobdir) != "False":
+        elif tags["LREAL"] != "False":
             print("  Set LREAL = .FALSE.")
             sys.stdout.flush()
             io.set_incar_tag({"LREAL":False}, jobdir=new_jobdir)
@@ -388,11 +391,12 @@ class InisymError(_CrashError):
     def fix(self, err_jobdir, new_jobdir, settings):
         """ Up symprec, or turn off symmetry"""
         continue_job(err_jobdir, new_jobdir, settings)
-        symprec = io.get_incar_tag("SYMPREC", jobdir = new_jobdir)
+        tags = io.get_incar_tags(["SYMPREC", "ISYM"], jobdir = new_jobdir)
+        symprec = tags["SYMPREC"]
         if symprec is None or symprec > 1.1e-8:
             print("  Set SYMPREC = 1e-8")
             io.set_incar_tag({"SYMPREC": 1e-8}, jobdir = new_jobdir)
-        elif io.get_incar_tag("ISYM", jobdir = new_jobdir) != 0:
+        elif tags["ISYM"] != 0:
             print("  Set ISYM = 0")
             io.set_incar_tag({"ISYM": 0}, jobdir = new_jobdir)
 
@@ -403,11 +407,12 @@ class SgrconError(_CrashError):
     def fix(self, err_jobdir, new_jobdir, settings):
         """ Up symprec, or turn off symmetry"""
         continue_job(err_jobdir, new_jobdir, settings)
-        symprec = io.get_incar_tag("SYMPREC", jobdir = new_jobdir)
+        tags = io.get_incar_tags(["SYMPREC", "ISYM"], jobdir = new_jobdir)
+        symprec = tags["SYMPREC"]
         if symprec is None or symprec > 1.1e-8:
             print("  Set SYMPREC = 1e-8")
             io.set_incar_tag({"SYMPREC": 1e-8}, jobdir = new_jobdir)
-        elif io.get_incar_tag("ISYM", jobdir = new_jobdir) != 0:
+        elif tags["ISYM"] != 0:
             print("  Set ISYM = 0")
             io.set_incar_tag({"ISYM": 0}, jobdir = new_jobdir)
 
@@ -472,10 +477,11 @@ class NoConvergeError(_RunError):
     def error(self, line=None, jobdir=None):
         """ Check if pattern found in line """
         # I don't like having to open the INCAR every time...
-        nelm = io.get_incar_tag("NELM", jobdir=jobdir)
+        tags = io.get_incar_tags(["NELM", "EDIFF"], jobdir=jobdir)
+        nelm = tags["NELM"]
         if nelm is None:
             nelm = 40
-        ediff = io.get_incar_tag("EDIFF", jobdir=jobdir)
+        ediff = tags["EDIFF"]
         if ediff is None:
             ediff = 1e-4
         # We know the SCF ended at exactly NELM steps
@@ -486,7 +492,7 @@ class NoConvergeError(_RunError):
                 if ediff*10. <= float(line.split()[3]):
                     return True
                 return False
-            except:
+            except (IndexError, ValueError):
                 return False
 
     def fix(self, err_jobdir, new_jobdir, settings):
@@ -7,6 +7,7 @@ from casm.vasp.io.io import \
     VaspIOError,\
     job_complete,\
     get_incar_tag,\
+    get_incar_tags,\
     set_incar_tag,\
     ionic_steps,\
     write_potcar,\
@@ -39,6 +40,7 @@ __all__ = [
     'VaspIOError',
     'job_complete',
     'get_incar_tag',
+    'get_incar_tags',
     'set_incar_tag',
     'ionic_steps',
     'write_potcar',
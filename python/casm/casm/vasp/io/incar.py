@@ -52,7 +52,7 @@ class Incar(object):
         self.tags = dict()
         try:
             file = open(filename,'r')
-        except:
+        except IOError:
             raise IncarError("Could not open file: '" + filename + "'")
 
         # parse INCAR into self.tags
@@ -49,6 +49,17 @@ def get_incar_tag(key, jobdir=None):
     return None
 
 
+def get_incar_tags(keys, jobdir=None):
+    """Opens INCAR in 'jobdir' once and returns a dict of 'key':value for each of 'keys'.
+        Keys not set in the INCAR have the value None.
+    """
+    if jobdir is None:
+        jobdir = os.getcwd()
+    tincar = incar.Incar(os.path.join(jobdir,"INCAR"))
+    tags = dict((k.lower(), v) for k, v in six.iteritems(tincar.tags))
+    return dict((key, tags.get(key.lower())) for key in keys)
+
+
 def set_incar_tag(tag_dict,jobdir=None, name=None):
     """Opens INCAR in 'jobdir', sets 'key' value, and writes INCAR
         If 'val' is None, the tag is removed from the INCAR.
@@ -80,7 +91,7 @@ def ionic_steps(jobdir=None):
     try:
         toszicar = oszicar.Oszicar(os.path.join(jobdir,"OSZICAR"))
         return len(toszicar.E)
-    except:
+    except Exception:
         raise VaspIOError("Could not read number of ionic steps from " + os.path.join(jobdir,"OSZICAR"))
 
 
@@ -148,32 +159,32 @@ def write_vasp_input(dirpath, incarfile, prim_kpointsfile, prim_poscarfile, supe
     print("  Reading SPECIES:", speciesfile)
     species_settings = species.species_settings(speciesfile)
     print("  Reading supercell POS:", super_poscarfile)
-    super = poscar.Poscar(super_poscarfile, species_settings)
+    super_poscar = poscar.Poscar(super_poscarfile, species_settings)
     print("  Reading INCAR:", incarfile)
-    super_incar = incar.Incar(incarfile, species_settings, super, sort)
+    super_incar = incar.Incar(incarfile, species_settings, super_poscar, sort)
     print("  Generating supercell KPOINTS")
     if strict_kpoints:
         super_kpoints = prim_kpoints
     else:
-        super_kpoints = prim_kpoints.super_kpoints(prim, super)
+        super_kpoints = prim_kpoints.super_kpoints(prim, super_poscar)
 
 
     # write main input files
     print("  Writing supercell POSCAR:", os.path.join(dirpath,'POSCAR'))
-    super.write(os.path.join(dirpath,'POSCAR'), sort)
+    super_poscar.write(os.path.join(dirpath,'POSCAR'), sort)
     print("  Writing INCAR:", os.path.join(dirpath,'INCAR'))
     super_incar.write(os.path.join(dirpath,'INCAR'))
     print("  Writing supercell KPOINTS:", os.path.join(dirpath,'KPOINTS'))
     super_kpoints.write(os.path.join(dirpath,'KPOINTS'))
     print("  Writing POTCAR:", os.path.join(dirpath,'POTCAR'))
-    write_potcar(os.path.join(dirpath,'POTCAR'), super, species_settings, sort)
+    write_potcar(os.path.join(dirpath,'POTCAR'), super_poscar, species_settings, sort)
 
     # copy extra input files
     if len(extra_input_files):
         print("  Copying extra input files", end=' ')
     for s in extra_input_files:
         print("    ", s)
-        shutil.copy(s,dirpath)
+        shutil.copyfile(s, os.path.join(dirpath, os.path.basename(s)))
 
     print("  DONE\n")
     sys.stdout.flush()
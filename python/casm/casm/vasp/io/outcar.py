@@ -59,14 +59,11 @@ class Outcar(object):
             try:
                 if re.search("generate k-points for:", line):
                     self.kpts = map(int, line.split()[-3:])
-            except:
+            except (IndexError, ValueError):
                 pass
 
-            try:
-                if re.search("Total CPU time used",line):
-                    self.complete = True
-            except:
-                raise OutcarError("Error reading 'Total CPU time used' from line: '" + line + "'\nIn file: '" + self.filename + "'")
+            if re.search("Total CPU time used",line):
+                self.complete = True
 
             try:
                 if re.search("LOOP",line):
@@ -75,19 +72,19 @@ class Outcar(object):
                         self.slowest_loop = t
                     elif t > self.slowest_loop:
                         self.slowest_loop = t
-            except:
+            except (IndexError, ValueError):
                 pass
 
             try:
                 if re.search("LORBIT", line):
                     self.lorbit = int(line.split()[2])
-            except:
+            except (IndexError, ValueError):
                 pass
 
             try:
                 if re.search("ISPIN", line):
                     self.ispin = int(line.split()[2])
-            except:
+            except (IndexError, ValueError):
                 pass
 
             try:
@@ -99,9 +96,9 @@ class Outcar(object):
                                 self.mag.append(float(line.split()[-1]))
                             if re.match("tot", line.split()[0]):
                                 break
-                        except:
+                        except (IndexError, ValueError):
                             pass
-            except:
+            except (IndexError, ValueError):
                 pass
 
             try:
@@ -112,7 +109,7 @@ class Outcar(object):
                     self.ngy = int(r.group(2))
                     self.ngz = int(r.group(3))
                     self.found_ngx = True
-            except:
+            except (IndexError, ValueError):
                 pass
 
         f.close()
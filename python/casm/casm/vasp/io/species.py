@@ -173,7 +173,7 @@ def write_species_settings(species, filename):
     """ Write a SPECIES file from a species dict """
     try:
         file = open(filename,'w')
-    except:
+    except IOError:
         raise SpeciesError("Could not open file for writing: '" + filename + "'")
     species.keys()[0].write_header(file)
     for s in sorted(species.keys()):
@@ -41,7 +41,7 @@ class VaspIO:
         if sort == False:
             try:
                 file = open(filename,'w')
-            except:
+            except IOError:
                 raise VaspIOError("Could not open file for writing: '" + filename + "'")
             for name in self.poscar.type_atoms:
                 potcar = open( os.path.join(self.species[name].potcardir,'POTCAR'))
@@ -119,10 +119,16 @@ class Relax(object):
     def update_rundir(self):
         """Find all .../config/vasp/relax/run.i directories, store paths in self.rundir list"""
         self.rundir = []
+        if not os.path.isdir(self.relaxdir):
+            return
+        # list the directory once, rather than checking for each run.i separately
+        contents = set(os.listdir(self.relaxdir))
         run_index = len(self.rundir)
-        while os.path.isdir( os.path.join(self.relaxdir, "run." + str(run_index))):
-                self.rundir.append( os.path.join(self.relaxdir, "run." + str(run_index)) )
-                run_index += 1
+        runname = "run." + str(run_index)
+        while runname in contents:
+            self.rundir.append(os.path.join(self.relaxdir, runname))
+            run_index += 1
+            runname = "run." + str(run_index)
 
 
     def add_errdir(self):
@@ -137,10 +143,14 @@ class Relax(object):
         if len(self.rundir) == 0:
             pass
         else:
+            parent, runname = os.path.split(self.rundir[-1])
+            contents = set(os.listdir(parent))
             err_index = len(self.errdir)
-            while os.path.isdir(self.rundir[-1] + "_err." + str(err_index)):
-                    self.errdir.append(self.rundir[-1] + "_err." + str(err_index))
-                    err_index += 1
+            errname = runname + "_err." + str(err_index)
+            while errname in contents:
+                self.errdir.append(os.path.join(parent, errname))
+                err_index += 1
+                errname = runname + "_err." + str(err_index)
 
 
     def setup(self, initdir, settings):
@@ -247,10 +257,11 @@ class Relax(object):
                     new_values = {"ISIF":2, "ISMEAR":-5, "NSW":0, "IBRION":-1}
 
                 # set INCAR system tag to denote 'final'
-                if io.get_incar_tag("SYSTEM", self.rundir[-1]) is None:
+                system = io.get_incar_tag("SYSTEM", self.rundir[-1])
+                if system is None:
                     new_values["SYSTEM"] = "final"
                 else:
-                    new_values["SYSTEM"] = io.get_incar_tag("SYSTEM", self.rundir[-1]) + " final"
+                    new_values["SYSTEM"] = system + " final"
 
                 io.set_incar_tag( new_values, self.rundir[-1])
                 print("  Set INCAR tags:", new_values, "\n")
@@ -363,17 +374,20 @@ class Relax(object):
         # if the latest run is complete:
         if io.job_complete(self.rundir[-1]):
 
+            tags = io.get_incar_tags(["SYSTEM", "ISIF", "NSW"], self.rundir[-1])
+
             # if it is a final constant volume run
-            if io.get_incar_tag("SYSTEM", self.rundir[-1]) != None:
-                if io.get_incar_tag("SYSTEM", self.rundir[-1]).split()[-1].strip().lower() == "final":
+            system = tags["SYSTEM"]
+            if system != None:
+                if system.split()[-1].strip().lower() == "final":
                 # if io.get_incar_tag("ISIF", self.rundir[-1]) == 2 and \
                 #    io.get_incar_tag("NSW", self.rundir[-1]) == 0 and \
                 #    io.get_incar_tag("ISMEAR", self.rundir[-1]) == -5:
                     return ("complete", None)
 
             # elif constant volume run (but not the final one)
-            if io.get_incar_tag("ISIF", self.rundir[-1]) in [0,1,2]:
-                if io.get_incar_tag("NSW", self.rundir[-1]) == len(io.Oszicar(os.path.join(self.rundir[-1],"OSZICAR")).E):
+            if tags["ISIF"] in [0,1,2]:
+                if tags["NSW"] == len(io.Oszicar(os.path.join(self.rundir[-1],"OSZICAR")).E):
                     return ("incomplete", "relax")      # static run hit NSW limit and so isn't "done"
                 else:
                     return ("incomplete", "constant")
@@ -123,8 +123,8 @@ class Converge(object):
         self.prop = prop
 
         # get the configname from the configdir path
-        _res = os.path.split(configdir)
-        self.configname = os.path.split(_res[0])[1] + "/" + _res[1]
+        scelpath, configid = os.path.split(configdir)
+        self.configname = os.path.basename(scelpath) + "/" + configid
         print("  Configuration:", self.configname)
 
         print("Reading CASM settings")
@@ -147,8 +147,9 @@ class Converge(object):
         self.calcdir = self.casm_directories.calctype_dir(self.configname, self.clex)
         try:
             os.mkdir(self.calcdir)
-        except:
-            pass
+        except OSError:
+            if not os.path.isdir(self.calcdir):
+                raise
         print("  Calculations directory:", self.calcdir)
 
         # read the settings json file
@@ -229,19 +230,14 @@ class Converge(object):
             self.prop_list = range(self.settings["prop_start"], self.settings["prop_stop"] + self.settings["prop_step"], self.settings["prop_step"])
 
         # Making all the directories
-        self.prop_dir_list = []
-        for prop in self.prop_list:
-            if isinstance(prop, list):
-                self.prop_dir_list += [os.path.join(self.calcdir, self.prop_name % tuple(prop))]
-            else:
-                self.prop_dir_list += [os.path.join(self.calcdir, self.prop_name % prop)]
+        self.prop_dir_list = [os.path.join(self.calcdir, self.prop_name % (tuple(prop) if isinstance(prop, list) else prop))
+                              for prop in self.prop_list]
+        for propdir in self.prop_dir_list:
             try:
-                if isinstance(prop, list):
-                    os.mkdir(os.path.join(self.calcdir, self.prop_name % tuple(prop)))
-                else:
-                    os.mkdir(os.path.join(self.calcdir, self.prop_name % prop))
+                os.mkdir(propdir)
             except OSError:
-                pass
+                if not os.path.isdir(propdir):
+                    raise
 
         print("  DONE\n")
         sys.stdout.flush()
@@ -511,17 +507,17 @@ class Converge(object):
         if self.settings["prop"].upper() == "ENCUT":
             try:
                 incar.tags["ENCUT"] = int(self.prop)
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in Cconverge.collect: something has gone wrong and the run-specific property %s could not be cast as int!" % self.prop)
         elif self.settings["prop"].upper() == "NBANDS":
             try:
                 incar.tags["NBANDS"] = int(self.prop)
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in Converge.collect: something has gone wrong and the run-specific property %s could not be cast as int!" % self.prop)
         elif self.settings["prop"].upper() == "SIGMA":
             try:
                 incar.tags["SIGMA"] = float(self.prop)
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in Converge.collect: something has gone wrong and the run-specific property %s could not be cast as int!" % self.prop)
         elif self.settings["prop"].upper() == "KPOINTS":
             if isinstance(self.prop, list):
@@ -551,7 +547,7 @@ class Converge(object):
         print("  Copying extra input files", end=' ')
         for my_input_file in extra_input_files:
             print(my_input_file, end=' ')
-            shutil.copy(my_input_file, self.propdir)
+            shutil.copyfile(my_input_file, os.path.join(self.propdir, os.path.basename(my_input_file)))
         print("")
 
         print("VASP input files complete\n")
@@ -563,6 +559,10 @@ class Converge(object):
         print("Submitting...")
         print("Configuration:", self.configname)
         print("Property:", self.settings["prop"])
+        # the atom count and the commands around the run command are the same for every
+        #   value of the property, so they are only determined once, when first needed
+        N = None #pylint: disable=invalid-name
+        cmd_prefix, cmd_suffix = None, None
         # Iterate over each individual value of the property, since parallelism!
         for prop, propdir in zip(self.prop_list, self.prop_dir_list):
             try:
@@ -642,25 +642,18 @@ class Converge(object):
                 os.chdir(propdir)
 
                 # determine the number of atoms in the configuration
-                print("  Counting atoms in the POSCAR")
-                sys.stdout.flush()
-                pos = vasp.io.Poscar(os.path.join(self.configdir, "POS"))
-                N = len(pos.basis) #pylint: disable=invalid-name
+                if N is None:
+                    print("  Counting atoms in the POSCAR")
+                    sys.stdout.flush()
+                    pos = vasp.io.Poscar(os.path.join(self.configdir, "POS"))
+                    N = len(pos.basis) #pylint: disable=invalid-name
 
                 # Construct the run command
-                cmd = ""
-                if self.settings["preamble"] is not None:
-                # Append any instructions given in the 'preamble' file, if given
-                    preamble = self.casm_directories.settings_path_crawl(self.settings["preamble"], self.configname, self.clex)
-                    with open(preamble, 'rb') as my_preamble:
-                        cmd += "".join(my_preamble.read().decode('utf-8'))
-                # Or just execute a single prerun line, if given
-                if self.settings["prerun"] is not None:
-                    cmd += self.settings["prerun"] + "\n"
+                if cmd_prefix is None:
+                    cmd_prefix, cmd_suffix = self._run_cmd_parts()
+                cmd = cmd_prefix
                 cmd += "python -c \"import casm.vaspwrapper; casm.vaspwrapper.Converge(configdir='" + self.configdir + "', propdir='" + propdir + "', prop=" + str(prop) + ").run()\"\n"
-
-                if self.settings["postrun"] is not None:
-                    cmd += self.settings["postrun"] + "\n"
+                cmd += cmd_suffix
 
                 print("  Constructing a job")
                 sys.stdout.flush()
@@ -698,6 +691,27 @@ class Converge(object):
         sys.stdout.flush()
 
 
+    def _run_cmd_parts(self):
+        """ Return the (prefix, suffix) of the command run by submitted jobs
+
+            The prefix is the contents of the 'preamble' file and the 'prerun' line,
+            and the suffix is the 'postrun' line, if given.
+        """
+        prefix = ""
+        if self.settings["preamble"] is not None:
+        # Append any instructions given in the 'preamble' file, if given
+            preamble = self.casm_directories.settings_path_crawl(self.settings["preamble"], self.configname, self.clex)
+            with open(preamble, 'rb') as my_preamble:
+                prefix += "".join(my_preamble.read().decode('utf-8'))
+        # Or just execute a single prerun line, if given
+        if self.settings["prerun"] is not None:
+            prefix += self.settings["prerun"] + "\n"
+
+        suffix = ""
+        if self.settings["postrun"] is not None:
+            suffix += self.settings["postrun"] + "\n"
+        return (prefix, suffix)
+
     def run_settings(self):
         """ Set default values based on runtime environment"""
         settings = dict(self.settings)
@@ -806,11 +820,13 @@ class Converge(object):
 
             # print a local settings file, so that the run_limit can be extended if the
             #   convergence problems are fixed
+            config_set_dir = os.path.join(self.configdir, "settings", self.casm_settings["curr_calctype"], self.settings["prop"] + "_converge")
             try:
-                os.makedirs(os.path.join(self.configdir, "settings", self.casm_settings["curr_calctype"], self.settings["prop"]+"_converge"))
+                os.makedirs(config_set_dir)
             except OSError:
-                pass
-            settingsfile = os.path.join(self.configdir, "settings", self.casm_settings["curr_calctype"], self.settings["prop"] + "_converge", "converge.json")
+                if not os.path.isdir(config_set_dir):
+                    raise
+            settingsfile = os.path.join(config_set_dir, "converge.json")
             write_settings(self.settings, settingsfile)
 
             print("Writing:", settingsfile)
@@ -894,7 +910,7 @@ class Converge(object):
                     return False
                 break
             ### WHY IS THIS HERE
-            except: #pylint: disable=bare-except
+            except Exception: #pylint: disable=broad-except
                 pass
 
         # Verify that the final static run reached electronic convergence
@@ -912,49 +928,49 @@ class Converge(object):
         try:
             if not self.settings["prop"].upper() in VALID_PROP_TYPES:
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"prop: %s\" not a valid convergence prop type!\nCurrently supported convergence prop types are %s" % (self.settings["prop"], VALID_PROP_TYPES))
-        except:
+        except (KeyError, AttributeError):
             raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"prop: %s\" missing, or could not be converted to a string!\nCurrently supported convergence prop types are %s" % (self.settings["prop"], VALID_PROP_TYPES))
         # ENCUT requires an int for start, stop, and step
         if self.settings["prop"].upper() == "ENCUT":
             try:
                 self.settings["prop_start"] = int(self.settings["prop_start"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_start for prop ENCUT. I found: %s" % self.settings["prop_start"])
             try:
                 self.settings["prop_step"] = int(self.settings["prop_step"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_step for prop ENCUT. I found: %s" % self.settings["prop_step"])
             try:
                 self.settings["prop_stop"] = int(self.settings["prop_stop"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_stop for prop ENCUT. I found: %s" % self.settings["prop_step"])
         # NBANDS requires an int for start, stop, and step
         elif self.settings["prop"].upper() == "NBANDS":
             try:
                 self.settings["prop_start"] = int(self.settings["prop_start"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_start for prop NBANDS. I found: %s" % self.settings["prop_start"])
             try:
                 self.settings["prop_step"] = int(self.settings["prop_step"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_step for prop NBANDS. I found: %s" % self.settings["prop_step"])
             try:
                 self.settings["prop_stop"] = int(self.settings["prop_stop"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer prop_stop for prop NBANDS. I found: %s" % self.settings["prop_step"])
         # SIGMA requires a float for start, stop, and step
         elif self.settings["prop"].upper() == "SIGMA":
             try:
                 self.settings["prop_start"] = float(self.settings["prop_start"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain float prop_start for prop SIGMA. I found: %s" % self.settings["prop_start"])
             try:
                 self.settings["prop_step"] = float(self.settings["prop_step"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain float prop_step for prop SIGMA. I found: %s" % self.settings["prop_step"])
             try:
                 self.settings["prop_stop"] = float(self.settings["prop_stop"])
-            except:
+            except (TypeError, ValueError):
                 raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain float prop_stop for prop SIGMA. I found: %s" % self.settings["prop_step"])
         # KPOINTS requires either an int or a length-3 list of ints for start, stop, and step
         elif self.settings["prop"].upper() == "KPOINTS":
@@ -963,25 +979,25 @@ class Converge(object):
             except TypeError:
                 try:
                     self.settings["prop_start"] = [int(k) for k in self.settings["prop_start"]]
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain integer or 3-list of integer prop_start for prop KPOINTS. I found: %s" % self.settings["prop_start"])
             if isinstance(self.settings["prop_start"], list):
                 try:
                     self.settings["prop_step"] = [int(k) for k in self.settings["prop_step"]]
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain prop_step of the same type as prop_start for prop KPOINTS. I found: %s" % self.settings["prop_step"])
                 try:
                     self.settings["prop_stop"] = [int(k) for k in self.settings["prop_stop"]]
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain prop_stop of the same type as prop_start for prop KPOINTS. I found: %s" % self.settings["prop_stop"])
             else:
                 try:
                     self.settings["prop_step"] = int(self.settings["prop_step"])
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain prop_step of the same type as prop_start for prop KPOINTS. I found: %s" % self.settings["prop_step"])
                 try:
                     self.settings["prop_stop"] = int(self.settings["prop_stop"])
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): converge.json must contain prop_stop of the same type as prop_start for prop KPOINTS. I found: %s" % self.settings["prop_stop"])
 
         # If "tol" is present, check for a valid tol type and "tol_amount" value
@@ -993,11 +1009,11 @@ class Converge(object):
                     try:
                         if not my_tol.lower() in VALID_TOL_TYPES:
                             raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol: %s\" not a valid convergence tolerance type!\nCurrently supported convergence tolerance types are %s" % (self.settings["tol"], VALID_TOL_TYPES))
-                    except:
+                    except AttributeError:
                         raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol: %s\" not a valid convergence tolerance type!\nCurrently supported convergence tolerance types are %s" % (self.settings["tol"], VALID_TOL_TYPES))
                     try:
                         my_tol_amount = abs(float(my_tol_amount))
-                    except:
+                    except (TypeError, ValueError):
                         raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol_amount: %s\" cannot be converted to float, but a float is needed!" % self.settings["tol_amount"])
             else:
                 try:
@@ -1005,12 +1021,12 @@ class Converge(object):
                         raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol: %s\" not a valid convergence tolerance type!\nCurrently supported convergence tolerance types are %s" % (self.settings["tol"], VALID_TOL_TYPES))
                     else:
                         self.settings["tol"] = [self.settings["tol"]]
-                except:
+                except AttributeError:
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol: %s\" not a valid convergence tolerance type!\nCurrently supported convergence tolerance types are %s" % (self.settings["tol"], VALID_TOL_TYPES))
 
                 try:
                     self.settings["tol_amount"] = [abs(float(self.settings["tol_amount"]))]
-                except:
+                except (TypeError, ValueError):
                     raise ConvergeError("Error in casm.vaspwrapper.Converge(): \"tol_amount: %s\" cannot be converted to float, but a float is needed!" % self.settings["tol_amount"])
 
     @property
@@ -1070,7 +1086,7 @@ class Converge(object):
                 lat[0][0]*(lat[1][1]*lat[2][2] - lat[1][2]*lat[2][1])
                 - lat[0][1]*(lat[1][0]*lat[2][2] - lat[1][2]*lat[2][0])
                 + lat[0][2]*(lat[1][0]*lat[2][1] - lat[1][1]*lat[2][0]))
-        except:
+        except (IndexError, TypeError):
             raise RuntimeError("The given lattice %s could not be parsed as a 3-list of 3-vectors." % str(lat))
 
     @staticmethod
@@ -1082,7 +1098,7 @@ class Converge(object):
                 sqrt(lat[1][0]**2 + lat[1][1]**2 + lat[1][2]**2),
                 sqrt(lat[2][0]**2 + lat[2][1]**2 + lat[2][2]**2)
                 ]
-        except:
+        except (IndexError, TypeError):
             raise RuntimeError("The given lattice %s could not be parsed as a 3-list of 3-vectors." % str(lat))
 
     @staticmethod
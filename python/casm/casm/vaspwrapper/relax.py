@@ -94,8 +94,8 @@ class Relax(object):
         print("  Input directory:", configdir)
 
         # get the configname from the configdir path
-        _res = os.path.split(configdir)
-        self.configname = os.path.split(_res[0])[1] + "/" + _res[1]
+        scelpath, configid = os.path.split(configdir)
+        self.configname = os.path.basename(scelpath) + "/" + configid
         print("  Configuration:", self.configname)
 
         print("  Reading CASM settings")
@@ -118,8 +118,9 @@ class Relax(object):
         self.calcdir = self.casm_directories.calctype_dir(self.configname, self.clex)
         try:
             os.mkdir(self.calcdir)
-        except:
-            pass
+        except OSError:
+            if not os.path.isdir(self.calcdir):
+                raise
         print("  Calculations directory:", self.calcdir)
 
         # read the settings json file
@@ -208,11 +209,11 @@ class Relax(object):
         # first, check if the job has already been submitted and is not completed
         db = JobDB()
         print("Calculation directory:", self.calcdir)
-        id = db.select_regex_id("rundir", self.calcdir)
-        print("JobID:", id)
+        jobid = db.select_regex_id("rundir", self.calcdir)
+        print("JobID:", jobid)
         sys.stdout.flush()
-        if id != []:
-            for j in id:
+        if jobid != []:
+            for j in jobid:
                 job = db.select_job(j)
                 # taskstatus = ["Incomplete","Complete","Continued","Check","Error:.*","Aborted"]
                 # jobstatus = ["C","Q","R","E","W","H","M"]
@@ -240,7 +241,7 @@ class Relax(object):
 
             # ensure job marked as complete in db
             if self.auto:
-                for j in id:
+                for j in jobid:
                   job = db.select_job(j)
                   if job["taskstatus"] == "Incomplete":
                       try:
@@ -436,8 +437,9 @@ class Relax(object):
 
             try:
                 os.makedirs(config_set_dir)
-            except:
-                pass
+            except OSError:
+                if not os.path.isdir(config_set_dir):
+                    raise
             settingsfile = os.path.join(config_set_dir, "relax.json")
             write_settings(self.settings, settingsfile)
 
@@ -518,7 +520,7 @@ class Relax(object):
             self.report_status('failed','electronic_convergence')
             return False
           break
-        except:
+        except Exception:
           pass
 
       # Verify that the final static run reached electronic convergence
@@ -545,12 +547,12 @@ class Relax(object):
 
         if (super_poscarfile is not None) and (speciesfile is not None):
             species_settings = vasp.io.species_settings(speciesfile)
-            super = vasp.io.Poscar(super_poscarfile, species_settings)
-            unsort_dict = super.unsort_dict()
+            super_poscar = vasp.io.Poscar(super_poscarfile, species_settings)
+            unsort_dict = super_poscar.unsort_dict()
         else:
             # fake unsort_dict (unsort_dict[i] == i)
             unsort_dict = dict(zip(range(0,len(vrun.basis)),range(0,len(vrun.basis))))
-            super = vasp.io.Poscar(os.path.join(vaspdir,"POSCAR"))
+            super_poscar = vasp.io.Poscar(os.path.join(vaspdir,"POSCAR"))
 
         # unsort_dict:
         #   Returns 'unsort_dict', for which: unsorted_dict[orig_index] == sorted_index;
@@ -559,8 +561,8 @@ class Relax(object):
         #     'unsort_dict[0]' returns the index into the unsorted POSCAR of the first atom in the sorted POSCAR
 
 
-        output["atom_type"] = super.type_atoms
-        output["atoms_per_type"] = super.num_atoms
+        output["atom_type"] = super_poscar.type_atoms
+        output["atoms_per_type"] = super_poscar.num_atoms
         output["coord_mode"] = vrun.coord_mode
 
         # as lists
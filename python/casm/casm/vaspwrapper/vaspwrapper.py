@@ -120,7 +120,7 @@ def read_settings(filename):
 def write_settings(settings, filename):
     """ Write 'settings' as json file, 'filename' """
     with open(filename,'wb') as file:
-        file.write(six.u(json.dump( settings, file, indent=4)).encode('utf-8'))
+        file.write(six.u(json.dumps(settings, indent=4)).encode('utf-8'))
 
 
 def vasp_input_file_names(dir, configname, clex):
@@ -178,11 +178,9 @@ def vasp_input_file_names(dir, configname, clex):
 
     """
     # Find required input files in CASM project directory tree
-    incarfile = dir.settings_path_crawl("INCAR", configname, clex)
-    prim_kpointsfile = dir.settings_path_crawl("KPOINTS", configname, clex)
-    prim_poscarfile = dir.settings_path_crawl("POSCAR", configname, clex)
+    incarfile, prim_kpointsfile, prim_poscarfile, speciesfile = dir.settings_paths_crawl(
+        ["INCAR", "KPOINTS", "POSCAR", "SPECIES"], configname, clex)
     super_poscarfile = dir.POS(configname)
-    speciesfile = dir.settings_path_crawl("SPECIES", configname, clex)
 
     # Verify that required input files exist
     if incarfile is None:
@@ -6,6 +6,8 @@ import unittest
 import os
 from os.path import join
 import json
+import shutil
+import tempfile
 
 import numpy as np
 from casm import project
@@ -74,4 +76,48 @@ class TestCasmProject(CasmProjectTestCase):
                             np.array([ 2.,  2.,  0.])))
             self.assertTrue(np.allclose(comp_axes.end_members['a'],
                             np.array([ 2.,  0.,  2.])))
-            
+
+
+class TestCasmDirectoryStructure(CasmProjectTestCase):
+
+    def setUp(self):
+        """Construct a minimal project with a settings directory at each level"""
+        self.tmpdir = tempfile.mkdtemp()
+        os.mkdir(join(self.tmpdir, '.casm'))
+        self.dir = project.DirectoryStructure(self.tmpdir)
+        self.clex = project.ClexDescription('formation_energy', 'formation_energy',
+                                            'default', 'default', 'default', 'default')
+        self.configname = 'SCEL1_1_1_1_0_0_0/0'
+
+        files = {
+            self.dir.configuration_calc_settings_dir(self.configname, self.clex): ['INCAR', 'KPOINTS'],
+            self.dir.supercell_calc_settings_dir('SCEL1_1_1_1_0_0_0', self.clex): ['KPOINTS', 'POSCAR'],
+            self.dir.calc_settings_dir(self.clex): ['INCAR', 'POSCAR', 'SPECIES']}
+        for settings_dir, filenames in files.items():
+            os.makedirs(settings_dir)
+            for filename in filenames:
+                open(join(settings_dir, filename), 'w').close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_settings_paths_crawl(self):
+        """Test DirectoryStructure.settings_paths_crawl"""
+        config_dir = self.dir.configuration_calc_settings_dir(self.configname, self.clex)
+        scel_dir = self.dir.supercell_calc_settings_dir('SCEL1_1_1_1_0_0_0', self.clex)
+        calc_dir = self.dir.calc_settings_dir(self.clex)
+
+        filenames = ['INCAR', 'KPOINTS', 'POSCAR', 'SPECIES', 'relax.json']
+        paths = self.dir.settings_paths_crawl(filenames, self.configname, self.clex)
+        self.assertEqual(paths, [
+            join(config_dir, 'INCAR'),
+            join(config_dir, 'KPOINTS'),
+            join(scel_dir, 'POSCAR'),
+            join(calc_dir, 'SPECIES'),
+            None])
+        for filename, path in zip(filenames, paths):
+            self.assertEqual(path, self.dir.settings_path_crawl(filename, self.configname, self.clex))
+
+        # a configuration without its own settings directory falls back to the calctype settings
+        paths = self.dir.settings_paths_crawl(['INCAR', 'KPOINTS'], 'SCEL2_2_1_1_0_0_0/0', self.clex)
+        self.assertEqual(paths, [join(calc_dir, 'INCAR'), None])
@@ -0,0 +1,32 @@
+"""test_casm/test_vasp/test_io.py"""
+from __future__ import (absolute_import, division, print_function, unicode_literals)
+from builtins import *
+
+import unittest
+from os.path import join
+
+from casm.vasp import io
+
+import test_casm
+from test_casm.test_vasp import CasmVaspTestCase
+
+class TestCasmVaspIO(CasmVaspTestCase):
+
+    def setUp(self):
+        """Set the directory containing the test INCAR"""
+        self.jobdir = join(self.classdir, 'input_data', 'ZrO', 'SCEL1_1_1_1_0_0_0', '2')
+
+    def test_get_incar_tags(self):
+        """Test vasp.io.get_incar_tags()"""
+        keys = ["ENCUT", "isif", "Algo", "NSW", "EDIFF", "SYSTEM", "IMAGES"]
+        tags = io.get_incar_tags(keys, self.jobdir)
+
+        self.assertEqual(sorted(tags.keys()), sorted(keys))
+        self.assertEqual(tags["ENCUT"], 250)
+        self.assertEqual(tags["isif"], 3)
+        self.assertEqual(tags["Algo"], "Normal")
+        self.assertIsNone(tags["SYSTEM"])
+        self.assertIsNone(tags["IMAGES"])
+        for key in keys:
+            self.assertEqual(tags[key], io.get_incar_tag(key, self.jobdir))
+
@@ -0,0 +1,62 @@
+"""test_casm/test_vasp/test_settings.py"""
+from __future__ import (absolute_import, division, print_function, unicode_literals)
+from builtins import *
+
+import unittest
+from os.path import join
+import json
+import shutil
+import tempfile
+
+import six
+
+from casm.misc import noindent
+from casm import vaspwrapper
+
+import test_casm
+from test_casm.test_vasp import CasmVaspTestCase
+
+class _ReplaceNoIndentEncoder(noindent.NoIndentEncoder):
+    """NoIndentEncoder substituting placeholders one at a time with str.replace"""
+    def encode(self, o):
+        result = json.JSONEncoder.encode(self, o)
+        for k, v in six.iteritems(self._replacement_map):
+            result = result.replace('"@@%s@@"' % (k,), v)
+        return result
+
+class TestCasmVaspSettings(CasmVaspTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_noindent_encoder(self):
+        """Test noindent.NoIndentEncoder"""
+        basis = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.25, 0.75, 0.5]]
+        output = {
+            "atom_type": ["Zr", "O"],
+            "relaxed_basis": [noindent.NoIndent(v) for v in basis],
+            "relaxed_forces": [[noindent.NoIndent(v) for v in basis]],
+            "relaxed_lattice": noindent.NoIndent(basis),
+            "relaxed_energy": -12.5}
+        for kwargs in [dict(indent=4, sort_keys=True), dict(indent=2)]:
+            expected = json.dumps(output, cls=_ReplaceNoIndentEncoder, **kwargs)
+            result = json.dumps(output, cls=noindent.NoIndentEncoder, **kwargs)
+            self.assertEqual(result, expected)
+            self.assertNotIn("@@", result)
+            self.assertEqual(json.loads(result)["relaxed_basis"], basis)
+            self.assertEqual(json.loads(result)["relaxed_forces"], [basis])
+
+    def test_write_settings(self):
+        """Test vaspwrapper.write_settings() and vaspwrapper.read_settings()"""
+        filename = join(self.tmpdir, 'relax.json')
+        with open(filename, 'w') as f:
+            json.dump({"queue": "batch", "ppn": 16, "atom_per_proc": 2, "walltime": "1:00:00",
+                       "ncore": 4, "run_limit": 10}, f)
+        settings = vaspwrapper.read_settings(filename)
+
+        copyname = join(self.tmpdir, 'relax_copy.json')
+        vaspwrapper.write_settings(settings, copyname)
+        self.assertEqual(vaspwrapper.read_settings(copyname), settings)